@@ -1,13 +1,19 @@
-from typing import Optional
-
-# boto3 doesn't have stub files
-from boto3.session import Session  # type: ignore
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional
+from weakref import WeakKeyDictionary
 
 from .utils import Credentials
 
+if TYPE_CHECKING:  # pragma: no cover
+    from boto3.session import Session  # type: ignore
+
+# clients are expensive to create, so keep them for as long as their session is
+# alive (sessions are re-used across warm invocations)
+_CLIENT_CACHE: "WeakKeyDictionary[Session, Dict[str, Any]]" = WeakKeyDictionary()
+
 
 class SessionProxy:
-    def __init__(self, session: Session):
+    def __init__(self, session: "Session"):
         self.client = session.client
         self.resource = session.resource
 
@@ -17,10 +23,41 @@ def _get_boto_session(
 ) -> Optional[SessionProxy]:
     if not credentials:
         return None
-    session = Session(
-        aws_access_key_id=credentials.accessKeyId,
-        aws_secret_access_key=credentials.secretAccessKey,
-        aws_session_token=credentials.sessionToken,
-        region_name=region,
+    session = _build_session(
+        credentials.accessKeyId,
+        credentials.secretAccessKey,
+        credentials.sessionToken,
+        region,
     )
     return SessionProxy(session)
+
+
+@lru_cache(maxsize=16)
+def _build_session(
+    access_key_id: str,
+    secret_access_key: str,
+    session_token: str,
+    region: Optional[str] = None,
+) -> "Session":
+    # boto3 doesn't have stub files
+    import boto3  # type: ignore
+
+    # sessions are re-used across warm invocations, as long as the credentials
+    # don't change (rotated credentials come with a new session token, and so
+    # a new cache entry)
+    return boto3.Session(
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
+        aws_session_token=session_token,
+        region_name=region,
+    )
+
+
+def _cached_client(session: "Session", service_name: str) -> Any:
+    clients = _CLIENT_CACHE.get(session)
+    if clients is None:
+        clients = _CLIENT_CACHE[session] = {}
+    client = clients.get(service_name)
+    if client is None:
+        client = clients[service_name] = session.client(service_name)
+    return client
@@ -1,19 +1,19 @@
-import json
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from uuid import uuid4
 
-# boto3 doesn't have stub files
-from boto3 import Session  # type: ignore
-
+from .boto3_proxy import _cached_client
 from .interface import BaseResourceModel, HandlerErrorCode, OperationStatus
-from .utils import KitchenSinkEncoder
+from .utils import _fast_dumps
+
+if TYPE_CHECKING:  # pragma: no cover
+    from boto3.session import Session  # type: ignore
 
 LOG = logging.getLogger(__name__)
 
 
 def report_progress(  # pylint: disable=too-many-arguments
-    session: Session,
+    session: "Session",
     bearer_token: str,
     error_code: Optional[HandlerErrorCode],
     operation_status: OperationStatus,
@@ -21,25 +21,26 @@ def report_progress(  # pylint: disable=too-many-arguments
     resource_model: Optional[BaseResourceModel],
     status_message: str,
 ) -> None:
-    client = session.client("cloudformation")
+    client = _cached_client(session, "cloudformation")
     request = {
         "BearerToken": bearer_token,
         "OperationStatus": operation_status.name,
         "StatusMessage": status_message,
-        "ClientRequestToken": str(uuid4()),
+        "ClientRequestToken": uuid4().hex,
     }
     if resource_model:
-        request["ResourceModel"] = json.dumps(
-            resource_model._serialize(),  # pylint: disable=protected-access
-            cls=KitchenSinkEncoder,
+        request["ResourceModel"] = _fast_dumps(
+            resource_model._serialize()  # pylint: disable=protected-access
         )
     if error_code:
         request["ErrorCode"] = error_code.name
     if current_operation_status:
         request["CurrentOperationStatus"] = current_operation_status.name
     response = client.record_handler_progress(**request)
-    LOG.info(
-        "Record Handler Progress with Request Id %s and Request: {%s}",
-        response["ResponseMetadata"]["RequestId"],
-        request,
-    )
+    # skip the lookups (and building the arguments) when INFO is disabled
+    if LOG.isEnabledFor(logging.INFO):
+        LOG.info(
+            "Record Handler Progress with Request Id %s and Request: {%s}",
+            response["ResponseMetadata"]["RequestId"],
+            request,
+        )
@@ -86,25 +86,26 @@ class ProgressEvent:
     ) -> MutableMapping[str, Any]:
         # to match Java serialization, which drops `null` values, and the
         # contract tests currently expect this also
-        ser = {k: v for k, v in self.__dict__.items() if v is not None}
-        # mutate to what's expected in the response
-        if to_response:
-            ser["bearerToken"] = bearer_token
-            ser["operationStatus"] = ser.pop("status").name
-            if self.resourceModel:
-                # pylint: disable=protected-access
-                ser["resourceModel"] = self.resourceModel._serialize()
-            if self.resourceModels:
-                ser["resourceModels"] = [
-                    # pylint: disable=protected-access
-                    model._serialize()
-                    for model in self.resourceModels
-                ]
-            del ser["callbackDelaySeconds"]
-            if "callbackContext" in ser:
-                del ser["callbackContext"]
-            if self.errorCode:
-                ser["errorCode"] = self.errorCode.name
+        if not to_response:
+            return {k: v for k, v in self.__dict__.items() if v is not None}
+        # build what's expected in the response directly, rather than copying every
+        # field and then reshaping the copy (callbackContext and callbackDelaySeconds
+        # are never part of the response)
+        ser: MutableMapping[str, Any] = {"operationStatus": self.status.name}
+        if self.errorCode is not None:
+            ser["errorCode"] = self.errorCode.name
+        if self.message is not None:
+            ser["message"] = self.message
+        # pylint: disable=protected-access
+        if self.resourceModel is not None:
+            ser["resourceModel"] = self.resourceModel._serialize()
+        if self.resourceModels is not None:
+            ser["resourceModels"] = [
+                model._serialize() for model in self.resourceModels
+            ]
+        if self.nextToken is not None:
+            ser["nextToken"] = self.nextToken
+        ser["bearerToken"] = bearer_token
         return ser
 
     @classmethod
@@ -1,9 +1,6 @@
 import logging
 import time
-from typing import Any, Mapping, Optional
-
-# boto3 doesn't have stub files
-import boto3  # type: ignore
+from typing import Any, Mapping, Optional, Tuple
 
 
 class ProviderFilter(logging.Filter):
@@ -14,6 +11,10 @@ class ProviderFilter(logging.Filter):
 
 
 class ProviderLogHandler(logging.Handler):
+    # what the installed handler was last set up with, so warm invocations with
+    # the same settings and credentials can skip creating a new client
+    _installed_key: Optional[Tuple[Any, ...]] = None
+
     def __init__(
         self,
         group: str,
@@ -22,6 +23,8 @@ class ProviderLogHandler(logging.Handler):
         *args: Any,
         **kwargs: Any,
     ):
+        import boto3  # type: ignore
+
         super(ProviderLogHandler, self).__init__(*args, **kwargs)
         self.group = group
         self.stream = stream.replace(":", "__")
@@ -53,9 +56,20 @@ class ProviderLogHandler(logging.Handler):
         except KeyError:
             stream_name = f'{event_data["awsAccountId"]}-{event_data["region"]}'
 
-        log_handler = cls._get_existing_logger()
         if log_creds and log_group:
+            key = (
+                event_data.get("resourceType"),
+                event_data.get("awsAccountId"),
+                log_group,
+                log_creds.get("accessKeyId"),
+                log_creds.get("sessionToken"),
+            )
+            log_handler = cls._get_existing_logger()
             if log_handler:
+                if key == cls._installed_key:
+                    return
+                import boto3
+
                 # This is a re-used lambda container, log handler is already setup, so
                 # we just refresh the client with new creds
                 log_handler.client = boto3.client(
@@ -64,6 +78,7 @@ class ProviderLogHandler(logging.Handler):
                     aws_secret_access_key=log_creds["secretAccessKey"],
                     aws_session_token=log_creds["sessionToken"],
                 )
+                cls._installed_key = key
                 return
             # filter provider messages from platform
             ProviderFilter.PROVIDER = (
@@ -81,6 +96,7 @@ class ProviderLogHandler(logging.Handler):
             )
             # add log handler to root, so that provider gets plugin logs too
             logging.getLogger().addHandler(log_handler)
+            cls._installed_key = key
 
     def _create_log_group(self) -> None:
         try:
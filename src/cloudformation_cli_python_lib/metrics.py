@@ -1,17 +1,21 @@
 import datetime
 import logging
-from typing import Any, List, Mapping
-
-# boto3 doesn't have stub files
-from boto3.session import Session  # type: ignore
-
-from botocore.exceptions import ClientError  # type: ignore
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, List, Mapping
 
+from .boto3_proxy import _cached_client
 from .interface import Action, MetricTypes, StandardUnit
 
+if TYPE_CHECKING:  # pragma: no cover
+    from boto3.session import Session  # type: ignore
+
 LOG = logging.getLogger(__name__)
 
 METRIC_NAMESPACE_ROOT = "AWS/CloudFormation"
+MAX_METRICS_PER_REQUEST = 20
+
+# platform and provider metrics go to different accounts, and can be sent in parallel
+_EXECUTOR = ThreadPoolExecutor(max_workers=2)
 
 
 def format_dimensions(dimensions: Mapping[str, str]) -> List[Mapping[str, str]]:
@@ -19,11 +23,30 @@ def format_dimensions(dimensions: Mapping[str, str]) -> List[Mapping[str, str]]:
 
 
 class MetricPublisher:
-    def __init__(self, account_id: str, resource_type: str, session: Session) -> None:
+    def __init__(self, account_id: str, resource_type: str, session: "Session") -> None:
         suffix = resource_type.replace("::", "/")
         self.namespace = f"{METRIC_NAMESPACE_ROOT}/{account_id}/{suffix}"
         self.resource_type = resource_type
-        self.client = session.client("cloudwatch")
+        self.client = _cached_client(session, "cloudwatch")
+        self._metric_data: List[Mapping[str, Any]] = []
+
+    def add_metric(  # pylint: disable-msg=too-many-arguments
+        self,
+        metric_name: MetricTypes,
+        dimensions: Mapping[str, str],
+        unit: StandardUnit,
+        value: float,
+        timestamp: datetime.datetime,
+    ) -> None:
+        self._metric_data.append(
+            {
+                "MetricName": metric_name.name,
+                "Dimensions": format_dimensions(dimensions),
+                "Unit": unit.name,
+                "Timestamp": str(timestamp),
+                "Value": value,
+            }
+        )
 
     def publish_metric(  # pylint: disable-msg=too-many-arguments
         self,
@@ -33,22 +56,21 @@ class MetricPublisher:
         value: float,
         timestamp: datetime.datetime,
     ) -> None:
-        try:
-            self.client.put_metric_data(
-                Namespace=self.namespace,
-                MetricData=[
-                    {
-                        "MetricName": metric_name.name,
-                        "Dimensions": format_dimensions(dimensions),
-                        "Unit": unit.name,
-                        "Timestamp": str(timestamp),
-                        "Value": value,
-                    }
-                ],
-            )
+        self.add_metric(metric_name, dimensions, unit, value, timestamp)
+        self.flush()
 
-        except ClientError as e:
-            LOG.error("An error occurred while publishing metrics: %s", str(e))
+    def flush(self) -> None:
+        # botocore doesn't have stub files
+        from botocore.exceptions import ClientError  # type: ignore
+
+        metric_data, self._metric_data = self._metric_data, []
+        while metric_data:
+            batch = metric_data[:MAX_METRICS_PER_REQUEST]
+            metric_data = metric_data[MAX_METRICS_PER_REQUEST:]
+            try:
+                self.client.put_metric_data(Namespace=self.namespace, MetricData=batch)
+            except ClientError as e:
+                LOG.error("An error occurred while publishing metrics: %s", str(e))
 
 
 class MetricsPublisherProxy:
@@ -58,6 +80,17 @@ class MetricsPublisherProxy:
     def add_metrics_publisher(self, publisher: MetricPublisher) -> None:
         self._publishers.append(publisher)
 
+    # the publish_* methods only queue metrics, they are sent in as few
+    # PutMetricData calls as possible when flushed
+    def flush(self) -> None:
+        if len(self._publishers) < 2:
+            for publisher in self._publishers:
+                publisher.flush()
+            return
+        futures = [_EXECUTOR.submit(publisher.flush) for publisher in self._publishers]
+        for future in futures:
+            future.result()
+
     def publish_exception_metric(
         self, timestamp: datetime.datetime, action: Action, error: Any
     ) -> None:
@@ -67,7 +100,7 @@ class MetricsPublisherProxy:
                 "DimensionKeyExceptionType": str(type(error)),
                 "DimensionKeyResourceType": publisher.resource_type,
             }
-            publisher.publish_metric(
+            publisher.add_metric(
                 metric_name=MetricTypes.HandlerException,
                 dimensions=dimensions,
                 unit=StandardUnit.Count,
@@ -83,7 +116,7 @@ class MetricsPublisherProxy:
                 "DimensionKeyActionType": action.name,
                 "DimensionKeyResourceType": publisher.resource_type,
             }
-            publisher.publish_metric(
+            publisher.add_metric(
                 metric_name=MetricTypes.HandlerInvocationCount,
                 dimensions=dimensions,
                 unit=StandardUnit.Count,
@@ -99,7 +132,7 @@ class MetricsPublisherProxy:
                 "DimensionKeyActionType": action.name,
                 "DimensionKeyResourceType": publisher.resource_type,
             }
-            publisher.publish_metric(
+            publisher.add_metric(
                 metric_name=MetricTypes.HandlerInvocationDuration,
                 dimensions=dimensions,
                 unit=StandardUnit.Milliseconds,
@@ -116,7 +149,7 @@ class MetricsPublisherProxy:
                 "DimensionKeyExceptionType": str(type(error)),
                 "DimensionKeyResourceType": publisher.resource_type,
             }
-            publisher.publish_metric(
+            publisher.add_metric(
                 metric_name=MetricTypes.HandlerException,
                 dimensions=dimensions,
                 unit=StandardUnit.Count,
@@ -1,14 +1,20 @@
-import json
 import logging
 from datetime import datetime
 from functools import wraps
-from time import sleep
-from typing import Any, Callable, MutableMapping, Optional, Tuple, Type, Union
-
-# boto3 doesn't have stub files
-import boto3  # type: ignore
+from time import monotonic, sleep
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
-from .boto3_proxy import SessionProxy, _get_boto_session
+from .boto3_proxy import SessionProxy, _build_session, _get_boto_session
 from .callback import report_progress
 from .exceptions import InternalFailure, InvalidRequest, _HandlerError
 from .interface import (
@@ -25,16 +31,22 @@ from .utils import (
     BaseResourceModel,
     Credentials,
     HandlerRequest,
-    KitchenSinkEncoder,
     LambdaContext,
     TestEvent,
     UnmodelledRequest,
+    _normalize,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    from boto3.session import Session  # type: ignore
+
 LOG = logging.getLogger(__name__)
 
-MUTATING_ACTIONS = (Action.CREATE, Action.UPDATE, Action.DELETE)
+# Action is a str enum, so plain action names match members of this set too
+MUTATING_ACTIONS = frozenset((Action.CREATE, Action.UPDATE, Action.DELETE))
 INVOCATION_TIMEOUT_MS = 60000
+# plain dict lookup, avoids going through EnumMeta.__getitem__ on every request
+_ACTION_BY_NAME: Mapping[str, Action] = {action.name: action for action in Action}
 
 HandlerSignature = Callable[
     [Optional[SessionProxy], Any, MutableMapping[str, Any]], ProgressEvent
@@ -51,16 +63,31 @@ def _ensure_serialize(
     def wrapper(self: Any, event: MutableMapping[str, Any], context: Any) -> Any:
         try:
             response = entrypoint(self, event, context)
-            serialized = json.dumps(response, cls=KitchenSinkEncoder)
         except Exception as e:  # pylint: disable=broad-except
             return ProgressEvent.failed(  # pylint: disable=protected-access
                 HandlerErrorCode.InternalFailure, str(e)
             )._serialize()
-        return json.loads(serialized)
+        try:
+            return _normalize(response)
+        # RecursionError covers circular references, which json reports as ValueError
+        except (TypeError, ValueError, RecursionError) as e:
+            LOG.exception("Failed to serialize response")
+            return ProgressEvent.failed(  # pylint: disable=protected-access
+                HandlerErrorCode.InternalFailure, str(e)
+            )._serialize()
 
     return wrapper
 
 
+def _flush_metrics(metrics: MetricsPublisherProxy) -> None:
+    # metrics are batched, make sure anything recorded before an error is sent
+    # too, without masking the original error
+    try:
+        metrics.flush()
+    except Exception:  # pylint: disable=broad-except
+        LOG.exception("Error publishing metrics")
+
+
 class Resource:
     def __init__(
         self, type_name: str, resouce_model_cls: Type[BaseResourceModel]
@@ -81,7 +108,8 @@ class Resource:
         handler_request: HandlerRequest,
         handler_response: ProgressEvent,
         context: LambdaContext,
-        session: boto3.Session,
+        session: "Session",
+        handler_returned_at: Optional[float] = None,
     ) -> bool:
         if handler_response.status != OperationStatus.IN_PROGRESS:
             return False
@@ -97,8 +125,20 @@ class Resource:
         # locally otherwise we re-invoke through CloudWatchEvents
         needed_ms_remaining = callback_delay_s * 1200 + INVOCATION_TIMEOUT_MS
         if callback_delay_s < 60 and remaining_ms > needed_ms_remaining:
-            sleep(callback_delay_s)
-            return True
+            elapsed_s = 0.0
+            if handler_returned_at is not None:
+                # time spent since the handler returned (flushing metrics, reporting
+                # progress) counts towards the delay
+                elapsed_s = monotonic() - handler_returned_at
+            sleep(max(0.0, callback_delay_s - elapsed_s))
+            # only re-run locally if a whole handler invocation still fits in the
+            # remaining runtime (the sleep may have overrun), otherwise fall back to
+            # CloudWatchEvents straight away. This is only checked after the full
+            # sleep, so an overrun bills up to ~59s of waiting before scheduling a
+            # re-invoke that fires at least 2 minutes out
+            if context.get_remaining_time_in_millis() > INVOCATION_TIMEOUT_MS * 1.1:
+                return True
+            callback_delay_s = 0
         callback_delay_min = int(callback_delay_s / 60)
         CloudWatchScheduler(boto3_session=session).reschedule_after_minutes(
             function_arn=context.invoked_function_arn,
@@ -113,16 +153,17 @@ class Resource:
         request: BaseResourceHandlerRequest,
         action: Action,
         callback_context: MutableMapping[str, Any],
+        is_mutable: Optional[bool] = None,
     ) -> ProgressEvent:
-        try:
-            handler = self._handlers[action]
-        except KeyError:
+        handler = self._handlers.get(action)
+        if handler is None:
             return ProgressEvent.failed(
                 HandlerErrorCode.InternalFailure, f"No handler for {action}"
             )
         progress = handler(session, request, callback_context)
         is_in_progress = progress.status == OperationStatus.IN_PROGRESS
-        is_mutable = action in MUTATING_ACTIONS
+        if is_mutable is None:
+            is_mutable = action in MUTATING_ACTIONS
         if is_in_progress and not is_mutable:
             raise InternalFailure("READ and LIST handlers must return synchronously.")
         return progress
@@ -143,7 +184,7 @@ class Resource:
             ).to_modelled(self._model_cls)
 
             session = _get_boto_session(creds, event.region_name)
-            action = Action[event.action]
+            action = _ACTION_BY_NAME[event.action]
         except Exception as e:  # pylint: disable=broad-except
             LOG.exception("Invalid request")
             raise InvalidRequest(f"{e} ({type(e).__name__})") from e
@@ -171,7 +212,7 @@ class Resource:
     def _parse_request(
         self, event_data: MutableMapping[str, Any]
     ) -> Tuple[
-        Tuple[Optional[SessionProxy], Optional[boto3.Session], boto3.Session],
+        Tuple[Optional[SessionProxy], Optional["Session"], "Session"],
         BaseResourceHandlerRequest,
         Action,
         MutableMapping[str, Any],
@@ -179,30 +220,31 @@ class Resource:
     ]:
         try:
             event = HandlerRequest.deserialize(event_data)
-            caller_creds = event.requestData.callerCredentials
-            provider_creds = event.requestData.providerCredentials
-            platform_creds = event.requestData.platformCredentials
+            request_data = event.requestData
+            caller_creds = request_data.callerCredentials
+            provider_creds = request_data.providerCredentials
+            platform_creds = request_data.platformCredentials
             request: BaseResourceHandlerRequest = UnmodelledRequest(
                 clientRequestToken=event.bearerToken,
-                desiredResourceState=event.requestData.resourceProperties,
-                previousResourceState=event.requestData.previousResourceProperties,
-                logicalResourceIdentifier=event.requestData.logicalResourceId,
+                desiredResourceState=request_data.resourceProperties,
+                previousResourceState=request_data.previousResourceProperties,
+                logicalResourceIdentifier=request_data.logicalResourceId,
             ).to_modelled(self._model_cls)
             caller_sess = _get_boto_session(caller_creds, event.region)
             # No need to proxy as platform creds are required in the request
-            platform_sess = boto3.Session(
-                aws_access_key_id=platform_creds.accessKeyId,
-                aws_secret_access_key=platform_creds.secretAccessKey,
-                aws_session_token=platform_creds.sessionToken,
+            platform_sess = _build_session(
+                platform_creds.accessKeyId,
+                platform_creds.secretAccessKey,
+                platform_creds.sessionToken,
             )
             provider_sess = None
             if provider_creds:
-                provider_sess = boto3.Session(
-                    aws_access_key_id=provider_creds.accessKeyId,
-                    aws_secret_access_key=provider_creds.secretAccessKey,
-                    aws_session_token=provider_creds.sessionToken,
+                provider_sess = _build_session(
+                    provider_creds.accessKeyId,
+                    provider_creds.secretAccessKey,
+                    provider_creds.sessionToken,
                 )
-            action = Action[event.action]
+            action = _ACTION_BY_NAME[event.action]
             callback_context = event.requestContext.get("callbackContext", {})
         except Exception as e:  # pylint: disable=broad-except
             LOG.exception("Invalid request")
@@ -220,11 +262,12 @@ class Resource:
     def __call__(  # pylint: disable=too-many-locals  # noqa: C901
         self, event_data: MutableMapping[str, Any], context: LambdaContext
     ) -> MutableMapping[str, Any]:
+        metrics = MetricsPublisherProxy()
         try:
             ProviderLogHandler.setup(event_data)
             sessions, request, action, callback, event = self._parse_request(event_data)
             caller_sess, provider_sess, platform_sess = sessions
-            metrics = MetricsPublisherProxy()
+            is_mutable = action in MUTATING_ACTIONS
             metrics.add_metrics_publisher(
                 MetricPublisher(event.awsAccountId, event.resourceType, platform_sess)
             )
@@ -254,24 +297,32 @@ class Resource:
                 )
             invoke = True
             while invoke:
-                metrics.publish_invocation_metric(datetime.utcnow(), action)
-                start_time = datetime.utcnow()
+                # one wall-clock timestamp per iteration for the metrics, the
+                # duration is measured with the (cheaper) monotonic clock
+                now = datetime.utcnow()
+                start_time = monotonic()
                 error = None
                 try:
                     progress = self._invoke_handler(
-                        caller_sess, request, action, callback
+                        caller_sess, request, action, callback, is_mutable=is_mutable
                     )
                 except Exception as e:  # pylint: disable=broad-except
                     error = e
-                m_secs = (datetime.utcnow() - start_time).total_seconds() * 1000.0
-                metrics.publish_duration_metric(datetime.utcnow(), action, m_secs)
+                end_time = monotonic()
+                m_secs = (end_time - start_time) * 1000.0
+                metrics.publish_invocation_metric(now, action)
+                metrics.publish_duration_metric(now, action, m_secs)
                 if error:
-                    metrics.publish_exception_metric(datetime.utcnow(), action, error)
+                    # sent by the flush on the way out
+                    metrics.publish_exception_metric(now, action, error)
                     raise error
+                # send this iteration's metrics in one request, before a possible
+                # wait for the next local invocation
+                metrics.flush()
                 if progress.callbackContext:
                     callback = progress.callbackContext
                     event.requestContext["callbackContext"] = callback
-                if event.action in MUTATING_ACTIONS:
+                if is_mutable:
                     report_progress(
                         platform_sess,
                         event.bearerToken,
@@ -282,7 +333,7 @@ class Resource:
                         progress.message,
                     )
                 invoke = self.schedule_reinvocation(
-                    event, progress, context, platform_sess
+                    event, progress, context, platform_sess, end_time
                 )
         except _HandlerError as e:
             LOG.exception("Handler error", exc_info=True)
@@ -293,6 +344,8 @@ class Resource:
         except BaseException as e:  # pylint: disable=broad-except
             LOG.critical("Base exception caught (this is usually bad)", exc_info=True)
             progress = ProgressEvent.failed(HandlerErrorCode.InternalFailure, str(e))
+        finally:
+            _flush_metrics(metrics)
         return progress._serialize(  # pylint: disable=protected-access
             to_response=True, bearer_token=event_data.get("bearerToken")
         )
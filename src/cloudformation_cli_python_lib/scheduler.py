@@ -1,21 +1,21 @@
 import json
 import logging
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 from uuid import uuid4
 
-# boto3 doesn't have stub files
-from boto3 import Session  # type: ignore
+from .boto3_proxy import _cached_client
+from .utils import HandlerRequest, _kitchen_sink_default
 
-from botocore.exceptions import ClientError  # type: ignore
-
-from .utils import HandlerRequest, KitchenSinkEncoder
+if TYPE_CHECKING:  # pragma: no cover
+    from boto3.session import Session  # type: ignore
 
 LOG = logging.getLogger(__name__)
 
 
 class CloudWatchScheduler:
-    def __init__(self, boto3_session: Session):
-        self.client = boto3_session.client("events")
+    def __init__(self, boto3_session: "Session"):
+        self.client = _cached_client(boto3_session, "events")
 
     def reschedule_after_minutes(
         self, function_arn: str, minutes_from_now: int, handler_request: HandlerRequest
@@ -26,7 +26,9 @@ class CloudWatchScheduler:
         target_id = f"reinvoke-target-{uuid}"
         handler_request.requestContext["cloudWatchEventsRuleName"] = rule_name
         handler_request.requestContext["cloudWatchEventsTargetId"] = target_id
-        json_request = json.dumps(handler_request.serialize(), cls=KitchenSinkEncoder)
+        json_request = json.dumps(
+            handler_request.serialize(), default=_kitchen_sink_default
+        )
         LOG.info("Scheduling re-invoke at %s (%s)", cron, uuid)
         self.client.put_rule(Name=rule_name, ScheduleExpression=cron, State="ENABLED")
         self.client.put_targets(
@@ -35,6 +37,9 @@ class CloudWatchScheduler:
         )
 
     def cleanup_cloudwatch_events(self, rule_name: str, target_id: str) -> None:
+        # botocore doesn't have stub files
+        from botocore.exceptions import ClientError  # type: ignore
+
         try:
             if target_id and rule_name:
                 self.client.remove_targets(Rule=rule_name, Ids=[target_id])
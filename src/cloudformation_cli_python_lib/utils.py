@@ -1,19 +1,86 @@
 import json
 from dataclasses import dataclass, field
 from datetime import date, datetime, time
+from types import ModuleType
 from typing import Any, Callable, Mapping, MutableMapping, Optional, Type
 
 from .interface import Action, BaseResourceHandlerRequest, BaseResourceModel
 
+# orjson is an optional speedup, the stdlib encoder is used if it isn't present
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# keep orjson output close to KitchenSinkEncoder: dates and dataclasses are
+# routed through the default hook instead of orjson's native handling. orjson
+# still differs for NaN/Infinity (written as null, which is valid JSON) and
+# can't encode integers above 64 bits (those fall back to the stdlib encoder)
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    if orjson
+    else 0
+)
+
+
+def _kitchen_sink_default(o: Any) -> Any:
+    if isinstance(o, (datetime, date, time)):
+        return o.isoformat()
+    try:
+        return o._serialize()  # pylint: disable=protected-access
+    except AttributeError:
+        raise TypeError(
+            f"Object of type {type(o).__name__} is not JSON serializable"
+        ) from None
+
 
 class KitchenSinkEncoder(json.JSONEncoder):
     def default(self, o):  # type: ignore  # pylint: disable=method-hidden
-        if isinstance(o, (datetime, date, time)):
-            return o.isoformat()
+        return _kitchen_sink_default(o)
+
+
+def _fast_dumps(obj: Any) -> str:
+    if orjson:
         try:
-            return o._serialize()  # pylint: disable=protected-access
-        except AttributeError:
-            return super().default(o)
+            encoded: bytes = orjson.dumps(
+                obj, default=_kitchen_sink_default, option=_ORJSON_OPTIONS
+            )
+            return encoded.decode("utf-8")
+        except orjson.JSONEncodeError:
+            # e.g. integers above 64 bits, or genuinely unsupported types,
+            # which the stdlib encoder reports with its usual TypeError
+            pass
+    # passing the hook as default= (rather than cls=) keeps the C encoder
+    return json.dumps(obj, default=_kitchen_sink_default)
+
+
+def _normalize(o: Any) -> Any:
+    """Convert ``o`` into plain JSON types in a single pass, applying the same
+    hooks as ``KitchenSinkEncoder``. This produces the same JSON as (but is much
+    cheaper than) ``json.loads(json.dumps(o, cls=KitchenSinkEncoder))``, except
+    that ``str``/``int``/``float`` subclasses such as ``Action`` are returned as
+    is rather than converted to the base type.
+    """
+    if o is None or isinstance(o, (str, int, float)):
+        return o
+    if isinstance(o, dict):
+        return {_normalize_key(key): _normalize(value) for key, value in o.items()}
+    if isinstance(o, (list, tuple)):
+        return [_normalize(value) for value in o]
+    return _normalize(_kitchen_sink_default(o))
+
+
+def _normalize_key(key: Any) -> str:
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, (int, float)):
+        return json.dumps(key)
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+    )
 
 
 @dataclass
@@ -14,6 +14,7 @@ setup(
     zip_safe=True,
     python_requires=">=3.6",
     install_requires=["boto3>=1.10.20", 'dataclasses;python_version<"3.7"'],
+    extras_require={"orjson": ["orjson"]},
     license="Apache License 2.0",
     classifiers=[
         "Development Status :: 2 - Pre-Alpha",
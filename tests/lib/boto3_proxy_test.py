@@ -1,4 +1,12 @@
-from cloudformation_cli_python_lib.boto3_proxy import SessionProxy, _get_boto_session
+import subprocess
+import sys
+from unittest.mock import Mock
+
+from cloudformation_cli_python_lib.boto3_proxy import (
+    SessionProxy,
+    _cached_client,
+    _get_boto_session,
+)
 from cloudformation_cli_python_lib.utils import Credentials
 
 
@@ -10,3 +18,35 @@ def test_get_boto_session_returns_proxy():
 def test_get_boto_session_returns_none():
     proxy = _get_boto_session(None)
     assert proxy is None
+
+
+def test_import_does_not_load_boto3():
+    code = (
+        "import sys, cloudformation_cli_python_lib; "
+        "assert 'boto3' not in sys.modules and 'botocore' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_get_boto_session_reuses_session():
+    first = _get_boto_session(Credentials("a", "b", "c"), "us-east-1")
+    second = _get_boto_session(Credentials("a", "b", "c"), "us-east-1")
+    other_region = _get_boto_session(Credentials("a", "b", "c"), "us-west-2")
+    rotated = _get_boto_session(Credentials("a", "b", "d"), "us-east-1")
+
+    assert first.client.__self__ is second.client.__self__
+    assert first.client.__self__ is not other_region.client.__self__
+    assert first.client.__self__ is not rotated.client.__self__
+
+
+def test_cached_client_is_reused_per_session_and_service():
+    first_session, second_session = Mock(), Mock()
+    first_session.client.side_effect = lambda service_name: Mock()
+    second_session.client.side_effect = lambda service_name: Mock()
+
+    events = _cached_client(first_session, "events")
+    assert _cached_client(first_session, "events") is events
+    assert _cached_client(first_session, "cloudwatch") is not events
+    assert _cached_client(second_session, "events") is not events
+    assert first_session.client.call_count == 2
+    second_session.client.assert_called_once_with("events")
@@ -1,8 +1,14 @@
-# pylint: disable=redefined-outer-name,protected-access
+# pylint: disable=redefined-outer-name,protected-access,abstract-method
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
 from unittest.mock import Mock, patch
 from uuid import uuid4
 
 import boto3
+import pytest
+from cloudformation_cli_python_lib import utils
 from cloudformation_cli_python_lib.callback import report_progress
 from cloudformation_cli_python_lib.interface import (
     BaseResourceModel,
@@ -22,6 +28,16 @@ class MockSession:
         return self._cfn
 
 
+class CountingSession(MockSession):
+    def __init__(self):
+        super().__init__()
+        self.client_calls = 0
+
+    def client(self, _name):
+        self.client_calls += 1
+        return self._cfn
+
+
 def test_report_progress_minimal():
     session = MockSession()
     uuid = uuid4()
@@ -33,7 +49,7 @@ def test_report_progress_minimal():
         BearerToken="123",
         OperationStatus="IN_PROGRESS",
         StatusMessage="",
-        ClientRequestToken=str(uuid),
+        ClientRequestToken=uuid.hex,
     )
 
 
@@ -57,5 +73,53 @@ def test_report_progress_full():
         StatusMessage="test message",
         ResourceModel="{}",
         ErrorCode="InternalFailure",
-        ClientRequestToken=str(uuid),
+        ClientRequestToken=uuid.hex,
     )
+
+
+def test_report_progress_reuses_client():
+    session = CountingSession()
+    for _ in range(2):
+        report_progress(
+            session, "123", None, OperationStatus.IN_PROGRESS, None, None, ""
+        )
+    assert session.client_calls == 1
+    assert session._cfn.record_handler_progress.call_count == 2
+
+
+def test_report_progress_skips_log_when_info_disabled():
+    session = MockSession()
+    with patch("cloudformation_cli_python_lib.callback.LOG") as mock_log:
+        mock_log.isEnabledFor.return_value = False
+        report_progress(
+            session, "123", None, OperationStatus.IN_PROGRESS, None, None, ""
+        )
+    mock_log.isEnabledFor.assert_called_once_with(logging.INFO)
+    mock_log.info.assert_not_called()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_report_progress_serializes_resource_model(use_orjson):
+    @dataclass
+    class ResourceModel(BaseResourceModel):
+        name: str
+        created: datetime
+
+    created = datetime(2019, 1, 1, 12, 30)
+    session = MockSession()
+    orjson = utils.orjson if use_orjson else None
+    with patch("cloudformation_cli_python_lib.utils.orjson", orjson):
+        report_progress(
+            session,
+            "123",
+            None,
+            OperationStatus.IN_PROGRESS,
+            None,
+            ResourceModel("a", created),
+            "",
+        )
+    request = session._cfn.record_handler_progress.call_args[1]
+    assert json.loads(request["ResourceModel"]) == {
+        "name": "a",
+        "created": created.isoformat(),
+    }
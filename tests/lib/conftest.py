@@ -0,0 +1,14 @@
+# pylint: disable=protected-access
+import pytest
+from cloudformation_cli_python_lib import boto3_proxy
+
+
+@pytest.fixture(autouse=True)
+def reset_boto3_caches():
+    # sessions and clients are cached process-wide, don't leak (mocked) ones
+    # between tests
+    boto3_proxy._build_session.cache_clear()
+    boto3_proxy._CLIENT_CACHE.clear()
+    yield
+    boto3_proxy._build_session.cache_clear()
+    boto3_proxy._CLIENT_CACHE.clear()
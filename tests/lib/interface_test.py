@@ -104,6 +104,25 @@ def test_progress_event_serialize_to_response_with_models(message, bearer_token)
     }
 
 
+@given(s.sampled_from(HandlerErrorCode), s.text(ascii_letters))
+def test_progress_event_serialize_to_response_failed(error_code, bearer_token):
+    event = ProgressEvent(
+        status=OperationStatus.FAILED,
+        errorCode=error_code,
+        message="failed",
+        callbackDelaySeconds=5,
+        nextToken="token",
+    )
+
+    assert event._serialize(to_response=True, bearer_token=bearer_token) == {
+        "operationStatus": OperationStatus.FAILED.name,  # pylint: disable=no-member
+        "errorCode": error_code.name,
+        "message": "failed",
+        "nextToken": "token",
+        "bearerToken": bearer_token,
+    }
+
+
 def test_operation_status_enum_matches_sdk(client):
     sdk = set(client.meta.service_model.shape_for("OperationStatus").enum)
     enum = set(OperationStatus.__members__)
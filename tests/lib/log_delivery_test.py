@@ -9,6 +9,13 @@ from cloudformation_cli_python_lib.log_delivery import (
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_installed_key():
+    ProviderLogHandler._installed_key = None
+    yield
+    ProviderLogHandler._installed_key = None
+
+
 @pytest.fixture
 def mock_logger():
     return create_autospec(logging.getLogger())
@@ -33,9 +40,7 @@ def setup_patches(mock_logger):
         "cloudformation_cli_python_lib.log_delivery.logging.getLogger",
         return_value=mock_logger,
     )
-    patch_client = patch(
-        "cloudformation_cli_python_lib.log_delivery.boto3.client", autospec=True
-    )
+    patch_client = patch("boto3.client", autospec=True)
     patch__get_logger = patch(
         "cloudformation_cli_python_lib.log_delivery.ProviderLogHandler."
         "_get_existing_logger"
@@ -45,7 +50,7 @@ def setup_patches(mock_logger):
 
 @pytest.fixture
 def mock_provider_handler():
-    patch("cloudformation_cli_python_lib.log_delivery.boto3.client", autospec=True)
+    patch("boto3.client", autospec=True)
     plh = ProviderLogHandler(
         group="test-group",
         stream="test-stream",
@@ -110,6 +115,25 @@ def test_setup_existing_logger(setup_patches):
     mock_log.return_value.addHandler.assert_not_called()
 
 
+def test_setup_existing_logger_same_settings_skips_refresh(setup_patches):
+    existing = ProviderLogHandler("g", "s", {})
+    payload, p_logger, p_client, p__get_logger = setup_patches
+    with p_logger, p_client as mock_client, p__get_logger as mock_get:
+        mock_get.return_value = existing
+        ProviderLogHandler.setup(payload)
+        ProviderLogHandler.setup(payload)
+        mock_client.assert_called_once()
+
+        # rotated credentials need a new client
+        payload["requestData"]["providerCredentials"] = {
+            "accessKeyId": "AKI",
+            "secretAccessKey": "SAK2",
+            "sessionToken": "ST2",
+        }
+        ProviderLogHandler.setup(payload)
+    assert mock_client.call_count == 2
+
+
 def test_setup_without_provider_creds(mock_logger):
     patch_logger = patch(
         "cloudformation_cli_python_lib.log_delivery.logging.getLogger",
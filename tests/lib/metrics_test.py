@@ -1,10 +1,11 @@
 # pylint: disable=no-member
 from datetime import datetime
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import MagicMock, Mock, call, patch
 
 import boto3
 from cloudformation_cli_python_lib.interface import Action, MetricTypes, StandardUnit
 from cloudformation_cli_python_lib.metrics import (
+    MAX_METRICS_PER_REQUEST,
     MetricPublisher,
     MetricsPublisherProxy,
     format_dimensions,
@@ -63,13 +64,14 @@ def test_put_metric_catches_error(mock_logger):
 
 def test_publish_exception_metric():
     mock_client = patch("boto3.client")
-    mock_client.return_value = MagicMock()
+    mock_client.return_value = Mock()
 
     fake_datetime = datetime(2019, 1, 1)
     publisher = MetricPublisher("123412341234", "Aa::Bb::Cc", mock_client.return_value)
     proxy = MetricsPublisherProxy()
     proxy.add_metrics_publisher(publisher)
     proxy.publish_exception_metric(fake_datetime, Action.CREATE, Exception("fake-err"))
+    proxy.flush()
     expected_calls = [
         call.client("cloudwatch"),
         call.client().put_metric_data(
@@ -97,13 +99,14 @@ def test_publish_exception_metric():
 
 def test_publish_invocation_metric():
     mock_client = patch("boto3.client")
-    mock_client.return_value = MagicMock()
+    mock_client.return_value = Mock()
 
     fake_datetime = datetime(2019, 1, 1)
     publisher = MetricPublisher("123412341234", "Aa::Bb::Cc", mock_client.return_value)
     proxy = MetricsPublisherProxy()
     proxy.add_metrics_publisher(publisher)
     proxy.publish_invocation_metric(fake_datetime, Action.CREATE)
+    proxy.flush()
 
     expected_calls = [
         call.client("cloudwatch"),
@@ -128,13 +131,14 @@ def test_publish_invocation_metric():
 
 def test_publish_duration_metric():
     mock_client = patch("boto3.client")
-    mock_client.return_value = MagicMock()
+    mock_client.return_value = Mock()
 
     fake_datetime = datetime(2019, 1, 1)
     publisher = MetricPublisher("123412341234", "Aa::Bb::Cc", mock_client.return_value)
     proxy = MetricsPublisherProxy()
     proxy.add_metrics_publisher(publisher)
     proxy.publish_duration_metric(fake_datetime, Action.CREATE, 100)
+    proxy.flush()
 
     expected_calls = [
         call.client("cloudwatch"),
@@ -159,13 +163,14 @@ def test_publish_duration_metric():
 
 def test_publish_log_delivery_exception_metric():
     mock_client = patch("boto3.client")
-    mock_client.return_value = MagicMock()
+    mock_client.return_value = Mock()
 
     fake_datetime = datetime(2019, 1, 1)
     publisher = MetricPublisher("123412341234", "Aa::Bb::Cc", mock_client.return_value)
     proxy = MetricsPublisherProxy()
     proxy.add_metrics_publisher(publisher)
     proxy.publish_log_delivery_exception_metric(fake_datetime, TypeError("test"))
+    proxy.flush()
 
     expected_calls = [
         call.client("cloudwatch"),
@@ -193,3 +198,78 @@ def test_publish_log_delivery_exception_metric():
         ),
     ]
     assert expected_calls == mock_client.return_value.mock_calls
+
+
+def test_publish_metrics_are_batched():
+    mock_client = patch("boto3.client")
+    mock_client.return_value = Mock()
+
+    fake_datetime = datetime(2019, 1, 1)
+    publisher = MetricPublisher("123412341234", "Aa::Bb::Cc", mock_client.return_value)
+    proxy = MetricsPublisherProxy()
+    proxy.add_metrics_publisher(publisher)
+    proxy.publish_invocation_metric(fake_datetime, Action.CREATE)
+    proxy.publish_duration_metric(fake_datetime, Action.CREATE, 100)
+    proxy.publish_exception_metric(fake_datetime, Action.CREATE, Exception("fake-err"))
+    put_metric_data = mock_client.return_value.client.return_value.put_metric_data
+    put_metric_data.assert_not_called()
+
+    proxy.flush()
+    put_metric_data.assert_called_once()
+    assert [
+        datum["MetricName"] for datum in put_metric_data.call_args[1]["MetricData"]
+    ] == [
+        MetricTypes.HandlerInvocationCount.name,
+        MetricTypes.HandlerInvocationDuration.name,
+        MetricTypes.HandlerException.name,
+    ]
+
+    # nothing left to send
+    proxy.flush()
+    put_metric_data.assert_called_once()
+
+
+def test_flush_splits_large_batches():
+    mock_client = patch("boto3.client")
+    mock_client.return_value = Mock()
+
+    publisher = MetricPublisher("123412341234", "Aa::Bb::Cc", mock_client.return_value)
+    for _ in range(MAX_METRICS_PER_REQUEST + 1):
+        publisher.add_metric(
+            MetricTypes.HandlerInvocationCount,
+            {},
+            StandardUnit.Count,
+            1.0,
+            datetime(2019, 1, 1),
+        )
+    publisher.flush()
+
+    put_metric_data = mock_client.return_value.client.return_value.put_metric_data
+    assert [len(c[1]["MetricData"]) for c in put_metric_data.call_args_list] == [
+        MAX_METRICS_PER_REQUEST,
+        1,
+    ]
+
+
+def test_publishers_reuse_client_per_session():
+    session = MagicMock()
+    first = MetricPublisher("123412341234", "Aa::Bb::Cc", session)
+    second = MetricPublisher("123412341234", "Aa::Bb::Cc", session)
+    session.client.assert_called_once_with("cloudwatch")
+    assert first.client is second.client
+
+
+def test_flush_sends_to_all_publishers():
+    platform_session, provider_session = MagicMock(), MagicMock()
+    proxy = MetricsPublisherProxy()
+    proxy.add_metrics_publisher(
+        MetricPublisher("123412341234", "Aa::Bb::Cc", platform_session)
+    )
+    proxy.add_metrics_publisher(
+        MetricPublisher("123412341234", "Aa::Bb::Cc", provider_session)
+    )
+    proxy.publish_invocation_metric(datetime(2019, 1, 1), Action.CREATE)
+    proxy.flush()
+
+    for session in (platform_session, provider_session):
+        session.client.return_value.put_metric_data.assert_called_once()
@@ -12,7 +12,11 @@ from cloudformation_cli_python_lib.interface import (
     OperationStatus,
     ProgressEvent,
 )
-from cloudformation_cli_python_lib.resource import Resource, _ensure_serialize
+from cloudformation_cli_python_lib.resource import (
+    MUTATING_ACTIONS,
+    Resource,
+    _ensure_serialize,
+)
 
 ENTRYPOINT_PAYLOAD = {
     "awsAccountId": "123456789012",
@@ -103,6 +107,30 @@ def test_entrypoint_success():
     mock_handler.assert_called_once()
 
 
+def test_entrypoint_success_publishes_metrics_once_per_iteration():
+    resource = Resource(TYPE_NAME, Mock())
+    event = ProgressEvent(status=OperationStatus.SUCCESS, message="")
+    resource.handler(Action.CREATE)(Mock(return_value=event))
+
+    with patch(
+        "cloudformation_cli_python_lib.resource.ProviderLogHandler.setup"
+    ), patch(
+        "cloudformation_cli_python_lib.resource.report_progress", autospec=True
+    ), patch(
+        "cloudformation_cli_python_lib.resource.MetricsPublisherProxy"
+    ) as mock_metrics:
+        resource.__call__.__wrapped__(  # pylint: disable=no-member
+            resource, ENTRYPOINT_PAYLOAD, None
+        )
+
+    proxy = mock_metrics.return_value
+    proxy.publish_invocation_metric.assert_called_once()
+    proxy.publish_duration_metric.assert_called_once()
+    proxy.publish_exception_metric.assert_not_called()
+    # once for the iteration, and once more (with nothing left) on the way out
+    assert proxy.flush.call_count == 2
+
+
 def test_entrypoint_handler_raises():
     @dataclass
     class ResourceModel(BaseResourceModel):
@@ -128,7 +156,10 @@ def test_entrypoint_handler_raises():
             resource, ENTRYPOINT_PAYLOAD, None
         )
 
+    mock_metrics.return_value.publish_invocation_metric.assert_called_once()
+    mock_metrics.return_value.publish_duration_metric.assert_called_once()
     mock_metrics.return_value.publish_exception_metric.assert_called_once()
+    mock_metrics.return_value.flush.assert_called_once()
     assert event == {
         "errorCode": "InvalidRequest",
         "message": "handler failed",
@@ -236,9 +267,7 @@ def test__parse_request_valid_request():
 
     with patch(
         "cloudformation_cli_python_lib.resource._get_boto_session"
-    ) as mock_caller_session, patch(
-        "cloudformation_cli_python_lib.resource.boto3.Session"
-    ) as mock_platform_session:
+    ) as mock_caller_session, patch("boto3.Session") as mock_platform_session:
         ret = resource._parse_request(ENTRYPOINT_PAYLOAD)
     sessions, request, action, callback_context, _event = ret
     caller_sess, _, platform_sess = sessions
@@ -258,6 +287,22 @@ def test__parse_request_valid_request():
     assert callback_context == {}
 
 
+def test__parse_request_reuses_sessions():
+    resource = Resource(TYPE_NAME, Mock())
+
+    with patch("cloudformation_cli_python_lib.resource._get_boto_session"), patch(
+        "boto3.Session"
+    ) as mock_session:
+        mock_session.side_effect = lambda **kwargs: Mock()
+        first, *_ = resource._parse_request(ENTRYPOINT_PAYLOAD)
+        second, *_ = resource._parse_request(ENTRYPOINT_PAYLOAD)
+
+    assert mock_session.call_count == 2
+    assert first[1] is second[1]
+    assert first[2] is second[2]
+    assert first[1] is not first[2]
+
+
 @pytest.mark.parametrize("exc_cls", [Exception, BaseException])
 def test_entrypoint_uncaught_exception(resource, exc_cls):
     with patch("cloudformation_cli_python_lib.resource.ProviderLogHandler.setup"):
@@ -278,6 +323,28 @@ def test__ensure_serialize_uses_custom_encoder():
     assert json == {"foo": now.isoformat()}
 
 
+def test__ensure_serialize_entrypoint_raises_returns_progress_event():
+    @_ensure_serialize
+    def wrapped(_self, _event, _context):
+        raise ValueError("entrypoint failed")
+
+    serialized = wrapped(None, None, None)
+    event = ProgressEvent.failed(HandlerErrorCode.InternalFailure, "entrypoint failed")
+    assert serialized == event._serialize()
+
+
+def test__ensure_serialize_circular_reference_returns_progress_event():
+    @_ensure_serialize
+    def wrapped(_self, _event, _context):
+        value = {}
+        value["self"] = value
+        return value
+
+    serialized = wrapped(None, None, None)
+    assert serialized["status"] == OperationStatus.FAILED
+    assert serialized["errorCode"] == HandlerErrorCode.InternalFailure
+
+
 def test__ensure_serialize_invalid_returns_progress_event():
     @_ensure_serialize
     def wrapped(_self, _event, _context):
@@ -300,6 +367,20 @@ def test__ensure_serialize_invalid_returns_progress_event():
         assert serialized == event._serialize()
 
 
+@pytest.mark.parametrize(
+    "action,is_mutating",
+    [
+        (Action.CREATE, True),
+        ("UPDATE", True),
+        ("DELETE", True),
+        (Action.READ, False),
+        ("LIST", False),
+    ],
+)
+def test_mutating_actions_match_enum_and_name(action, is_mutating):
+    assert (action in MUTATING_ACTIONS) is is_mutating
+
+
 def test_handler_decorator(resource):
     deco = resource.handler(Action.CREATE)
     assert deco(sentinel.mock_handler) is sentinel.mock_handler
@@ -435,9 +516,7 @@ def test_test_entrypoint_success():
 
 def test_schedule_reinvocation_not_in_progress():
     progress = ProgressEvent(status=OperationStatus.SUCCESS)
-    with patch(
-        "cloudformation_cli_python_lib.resource.boto3.Session", autospec=True
-    ) as mock_session, patch(
+    with patch("boto3.Session", autospec=True) as mock_session, patch(
         "cloudformation_cli_python_lib.resource.CloudWatchScheduler", autospec=True
     ) as mock_scheduler:
         reinvoke = Resource.schedule_reinvocation(
@@ -449,6 +528,29 @@ def test_schedule_reinvocation_not_in_progress():
 
 
 def test_schedule_reinvocation_local_callback():
+    progress = ProgressEvent(status=OperationStatus.IN_PROGRESS, callbackDelaySeconds=5)
+    mock_request = Mock(
+        "cloudformation_cli_python_lib.interface.HandlerRequest", autospec=True
+    )()
+    mock_request.requestContext = {}
+    mock_context = Mock(
+        "cloudformation_cli_python_lib.interface.LambdaContext", autospec=True
+    )()
+    mock_context.get_remaining_time_in_millis.return_value = 600000
+    with patch(
+        "cloudformation_cli_python_lib.resource.sleep", autospec=True
+    ) as mock_sleep, patch(
+        "cloudformation_cli_python_lib.resource.monotonic", return_value=10.5
+    ):
+        reinvoke = Resource.schedule_reinvocation(
+            mock_request, progress, mock_context, sentinel.session, 10.0
+        )
+    assert reinvoke is True
+    mock_sleep.assert_called_once_with(4.5)
+    assert mock_request.requestContext.get("invocation") == 1
+
+
+def test_schedule_reinvocation_local_callback_without_return_time():
     progress = ProgressEvent(status=OperationStatus.IN_PROGRESS, callbackDelaySeconds=5)
     mock_request = Mock(
         "cloudformation_cli_python_lib.interface.HandlerRequest", autospec=True
@@ -466,7 +568,39 @@ def test_schedule_reinvocation_local_callback():
         )
     assert reinvoke is True
     mock_sleep.assert_called_once_with(5)
-    assert mock_request.requestContext.get("invocation") == 1
+
+
+def test_schedule_reinvocation_local_callback_overrun():
+    progress = ProgressEvent(status=OperationStatus.IN_PROGRESS, callbackDelaySeconds=5)
+    mock_request = Mock(
+        "cloudformation_cli_python_lib.interface.HandlerRequest", autospec=True
+    )()
+    mock_request.requestContext = {}
+    mock_context = Mock(
+        "cloudformation_cli_python_lib.interface.LambdaContext", autospec=True
+    )()
+    # enough time before sleeping, but not afterwards
+    mock_context.get_remaining_time_in_millis.side_effect = [600000, 60000]
+    mock_context.invoked_function_arn = "arn:aaa:bbb:ccc"
+    with patch(
+        "cloudformation_cli_python_lib.resource.CloudWatchScheduler", autospec=True
+    ) as mock_scheduler, patch(
+        "cloudformation_cli_python_lib.resource.sleep", autospec=True
+    ) as mock_sleep:
+        reinvoke = Resource.schedule_reinvocation(
+            mock_request, progress, mock_context, Mock()
+        )
+    assert reinvoke is False
+    mock_sleep.assert_called_once()
+    assert mock_scheduler.method_calls[0] == (
+        "().reschedule_after_minutes",
+        (),
+        {
+            "function_arn": "arn:aaa:bbb:ccc",
+            "minutes_from_now": 0,
+            "handler_request": mock_request,
+        },
+    )
 
 
 def test_schedule_reinvocation_cloudwatch_callback():
@@ -503,3 +637,15 @@ def test_schedule_reinvocation_cloudwatch_callback():
     )
     mock_sleep.assert_not_called()
     assert mock_request.requestContext.get("invocation") == 1
+
+
+def test__parse_request_invalid_action():
+    payload = ENTRYPOINT_PAYLOAD.copy()
+    payload["action"] = "NOT_AN_ACTION"
+    resource = Resource(TYPE_NAME, Mock())
+    with patch("cloudformation_cli_python_lib.resource._get_boto_session"), patch(
+        "boto3.Session"
+    ), pytest.raises(InvalidRequest) as excinfo:
+        resource._parse_request(payload)
+    assert "NOT_AN_ACTION" in str(excinfo.value)
+    assert "KeyError" in str(excinfo.value)
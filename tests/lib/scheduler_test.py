@@ -30,6 +30,13 @@ def test_instantiates_boto3_client(mock_boto3_session):
     assert cw_scheduler.client == mock_boto3_session.client.return_value
 
 
+def test_reuses_boto3_client_per_session(mock_boto3_session):
+    first = CloudWatchScheduler(boto3_session=mock_boto3_session)
+    second = CloudWatchScheduler(boto3_session=mock_boto3_session)
+    assert first.client is second.client
+    mock_boto3_session.client.assert_called_once_with("events")
+
+
 @patch(
     "cloudformation_cli_python_lib.scheduler.CloudWatchScheduler._min_to_cron",
     return_value="cron('30 16 21 11 ? 2019')",
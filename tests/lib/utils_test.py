@@ -1,7 +1,14 @@
 import json
+from datetime import datetime
+from unittest.mock import patch
 
 import pytest
-from cloudformation_cli_python_lib.utils import HandlerRequest, KitchenSinkEncoder
+from cloudformation_cli_python_lib.utils import (
+    HandlerRequest,
+    KitchenSinkEncoder,
+    _fast_dumps,
+    _normalize,
+)
 
 import hypothesis.strategies as s
 from hypothesis import given
@@ -98,3 +105,57 @@ def test_handler_request_serde_roundtrip():
     }
 
     assert ser == expected
+
+
+def test_fast_dumps_matches_kitchen_sink_encoder():
+    now = datetime.now()
+    value = {"a": [1, 2.5, None, True], "b": now, "c": {"d": "e"}}
+    assert json.loads(_fast_dumps(value)) == roundtrip(value)
+
+
+def test_fast_dumps_without_orjson_matches_kitchen_sink_encoder():
+    value = {"a": [1, 2.5, None, True], "b": datetime.now(), 1: {"d": "e"}}
+    with patch("cloudformation_cli_python_lib.utils.orjson", None):
+        serialized = _fast_dumps(value)
+    assert serialized == json.dumps(value, cls=KitchenSinkEncoder)
+
+
+def test_fast_dumps_int_above_64_bits_falls_back_to_stdlib():
+    value = {"a": 2 ** 70}
+    assert _fast_dumps(value) == json.dumps(value, cls=KitchenSinkEncoder)
+
+
+def test_fast_dumps_unsupported_type_raises_type_error():
+    class Unserializable:
+        pass
+
+    with pytest.raises(TypeError):
+        _fast_dumps(Unserializable())
+
+
+def test_normalize_matches_roundtrip():
+    now = datetime.now()
+
+    class Serializable:
+        @staticmethod
+        def _serialize():
+            return {"when": now, "nested": (1, 2)}
+
+    value = {"a": Serializable(), 1: [None, True, 1.5], None: "b", "c": (now,)}
+    assert _normalize(value) == roundtrip(value)
+
+
+def test_normalize_unsupported_type_raises_type_error():
+    class Unserializable:
+        pass
+
+    with pytest.raises(TypeError) as excinfo:
+        _normalize({"a": Unserializable()})
+    assert str(excinfo.value) == (
+        "Object of type Unserializable is not JSON serializable"
+    )
+
+
+def test_normalize_unsupported_key_raises_type_error():
+    with pytest.raises(TypeError):
+        _normalize({(1, 2): "a"})